@@ -1,45 +1,62 @@
 // import React from "react";
+import { Suspense, lazy } from "react";
 import { Routes, Route, Navigate, useLocation } from "react-router-dom";
 import Navbar from "./components/Navbar";
 import Home from "./pages/Home";
-import Ask from "./pages/Ask";
-import Quiz from "./pages/Quiz";
-import Dashboard from "./pages/Dashboard";
-import MainDashboard from "./pages/MainDashboard";
-
 import Login from "./pages/Login";
 import Register from "./pages/Register";
-import Courses from "./pages/Courses";
-import StudentEnrollments from "./pages/StudentEnrollments";
-import StudentAssignments from "./pages/StudentAssignments";
-import StudentGrades from "./pages/StudentGrades";
-import StudentAcademicRecords from "./pages/StudentAcademicRecords";
-import StudentCourseMaterials from "./pages/StudentCourseMaterials";
-import StudentDiscussions from "./pages/StudentDiscussions";
-import StudentAssessments from "./pages/StudentAssessments";
-import LecturerCourses from "./pages/LecturerCourses";
-import LecturerCourseManagement from "./pages/LecturerCourseManagement";
-import LecturerAssessments from "./pages/LecturerAssessments";
-import LecturerCourseDetails from "./pages/LecturerCourseDetails";
-import CourseAnalytics from "./pages/CourseAnalytics";
-import StudentManagement from "./pages/StudentManagement";
-import DepartmentManagement from "./pages/DepartmentManagement";
-import ProgramManagement from "./pages/ProgramManagement";
-import UserManagement from "./pages/UserManagement";
-import AssignmentManagement from "./pages/AssignmentManagement";
-import CourseManagement from "./pages/CourseManagement";
-import CampusCoordination from "./pages/CampusCoordination";
-import UserProfile from "./pages/UserProfile";
-import Settings from "./pages/Settings";
+// /dashboard is where every login lands, and MainDashboard lazy-loads the
+// role dashboard itself; importing it eagerly keeps that to one chunk fetch
+import MainDashboard from "./pages/MainDashboard";
+import RequireAuth from "./components/RequireAuth";
+import ChunkErrorBoundary from "./components/ChunkErrorBoundary";
 import { useAuth } from "./hooks/useAuth";
 
+// Signed-in pages are split into their own chunks and only downloaded when
+// first visited, keeping the landing/login bundle small
+const Ask = lazy(() => import("./pages/Ask"));
+const Quiz = lazy(() => import("./pages/Quiz"));
+const Dashboard = lazy(() => import("./pages/Dashboard"));
+const Courses = lazy(() => import("./pages/Courses"));
+const StudentEnrollments = lazy(() => import("./pages/StudentEnrollments"));
+const StudentAssignments = lazy(() => import("./pages/StudentAssignments"));
+const StudentGrades = lazy(() => import("./pages/StudentGrades"));
+const StudentAcademicRecords = lazy(
+  () => import("./pages/StudentAcademicRecords")
+);
+const StudentCourseMaterials = lazy(
+  () => import("./pages/StudentCourseMaterials")
+);
+const StudentDiscussions = lazy(() => import("./pages/StudentDiscussions"));
+const StudentAssessments = lazy(() => import("./pages/StudentAssessments"));
+const LecturerCourses = lazy(() => import("./pages/LecturerCourses"));
+const LecturerCourseManagement = lazy(
+  () => import("./pages/LecturerCourseManagement")
+);
+const LecturerAssessments = lazy(() => import("./pages/LecturerAssessments"));
+const LecturerCourseDetails = lazy(
+  () => import("./pages/LecturerCourseDetails")
+);
+const CourseAnalytics = lazy(() => import("./pages/CourseAnalytics"));
+const StudentManagement = lazy(() => import("./pages/StudentManagement"));
+const DepartmentManagement = lazy(() => import("./pages/DepartmentManagement"));
+const ProgramManagement = lazy(() => import("./pages/ProgramManagement"));
+const UserManagement = lazy(() => import("./pages/UserManagement"));
+const AssignmentManagement = lazy(() => import("./pages/AssignmentManagement"));
+const CourseManagement = lazy(() => import("./pages/CourseManagement"));
+const CampusCoordination = lazy(() => import("./pages/CampusCoordination"));
+const UserProfile = lazy(() => import("./pages/UserProfile"));
+const Settings = lazy(() => import("./pages/Settings"));
+
 function App() {
   const { user, loading } = useAuth();
   const location = useLocation();
 
   // Pages that should have full-screen layout without navbar and container
   const fullScreenPages = ["/", "/login", "/register"];
-  const isFullScreenPage = fullScreenPages.includes(location.pathname);
+  // Ignore a trailing slash so "/login/" gets the same layout as "/login"
+  const pathname = location.pathname.replace(/\/+$/, "") || "/";
+  const isFullScreenPage = fullScreenPages.includes(pathname);
 
   if (loading) {
     return (
@@ -71,133 +88,81 @@ function App() {
     <div className="min-h-screen bg-gray-50">
       <Navbar />
       <main className="container mx-auto px-4 py-8">
-        <Routes>
-          <Route path="/" element={<Home />} />
-          <Route
-            path="/login"
-            element={!user ? <Login /> : <Navigate to="/dashboard" />}
-          />
-          <Route
-            path="/register"
-            element={!user ? <Register /> : <Navigate to="/dashboard" />}
-          />
+        {/* Keyed on the path so a failed page doesn't keep showing its
+            fallback after the user navigates elsewhere */}
+        <ChunkErrorBoundary key={location.pathname}>
+          <Suspense
+            fallback={
+              <div className="flex items-center justify-center py-16">
+                <div className="animate-spin rounded-full h-12 w-12 border-b-2 border-primary-600"></div>
+              </div>
+            }
+          >
+            <Routes>
+              {/* "/", "/login" and "/register" are handled by the full-screen
+                  layout above and never reach this route table */}
 
-          {/* Protected routes */}
-          <Route
-            path="/ask"
-            element={user ? <Ask /> : <Navigate to="/login" />}
-          />
-          <Route
-            path="/quiz"
-            element={user ? <Quiz /> : <Navigate to="/login" />}
-          />
-          <Route
-            path="/dashboard"
-            element={user ? <MainDashboard /> : <Navigate to="/login" />}
-          />
-          <Route
-            path="/analytics"
-            element={user ? <Dashboard /> : <Navigate to="/login" />}
-          />
+              {/* Protected routes */}
+              <Route element={<RequireAuth />}>
+                <Route path="/ask" element={<Ask />} />
+                <Route path="/quiz" element={<Quiz />} />
+                <Route path="/dashboard" element={<MainDashboard />} />
+                <Route path="/analytics" element={<Dashboard />} />
 
-          {/* MasterLMS routes */}
-          <Route
-            path="/courses"
-            element={user ? <Courses /> : <Navigate to="/login" />}
-          />
-          <Route
-            path="/enrollments"
-            element={user ? <StudentEnrollments /> : <Navigate to="/login" />}
-          />
-          <Route
-            path="/my-assignments"
-            element={user ? <StudentAssignments /> : <Navigate to="/login" />}
-          />
-          <Route
-            path="/my-grades"
-            element={user ? <StudentGrades /> : <Navigate to="/login" />}
-          />
-          <Route
-            path="/academic-records"
-            element={
-              user ? <StudentAcademicRecords /> : <Navigate to="/login" />
-            }
-          />
-          <Route
-            path="/course-materials"
-            element={
-              user ? <StudentCourseMaterials /> : <Navigate to="/login" />
-            }
-          />
-          <Route
-            path="/discussions"
-            element={user ? <StudentDiscussions /> : <Navigate to="/login" />}
-          />
-          <Route
-            path="/student-assessments"
-            element={user ? <StudentAssessments /> : <Navigate to="/login" />}
-          />
-          <Route
-            path="/lecturer-course-management"
-            element={
-              user ? <LecturerCourseManagement /> : <Navigate to="/login" />
-            }
-          />
-          <Route
-            path="/lecturer-assessments"
-            element={user ? <LecturerAssessments /> : <Navigate to="/login" />}
-          />
-          <Route
-            path="/my-courses"
-            element={user ? <LecturerCourses /> : <Navigate to="/login" />}
-          />
-          <Route
-            path="/my-courses/:courseId"
-            element={
-              user ? <LecturerCourseDetails /> : <Navigate to="/login" />
-            }
-          />
-          <Route
-            path="/students"
-            element={user ? <StudentManagement /> : <Navigate to="/login" />}
-          />
-          <Route
-            path="/departments"
-            element={user ? <DepartmentManagement /> : <Navigate to="/login" />}
-          />
-          <Route
-            path="/programs"
-            element={user ? <ProgramManagement /> : <Navigate to="/login" />}
-          />
-          <Route
-            path="/user-management"
-            element={user ? <UserManagement /> : <Navigate to="/login" />}
-          />
-          <Route
-            path="/assignments"
-            element={user ? <AssignmentManagement /> : <Navigate to="/login" />}
-          />
-          <Route
-            path="/course-management"
-            element={user ? <CourseManagement /> : <Navigate to="/login" />}
-          />
-          <Route
-            path="/course-analytics"
-            element={user ? <CourseAnalytics /> : <Navigate to="/login" />}
-          />
-          <Route
-            path="/campus-coordination"
-            element={user ? <CampusCoordination /> : <Navigate to="/login" />}
-          />
-          <Route
-            path="/profile"
-            element={user ? <UserProfile /> : <Navigate to="/login" />}
-          />
-          <Route
-            path="/settings"
-            element={user ? <Settings /> : <Navigate to="/login" />}
-          />
-        </Routes>
+                {/* MasterLMS routes */}
+                <Route path="/courses" element={<Courses />} />
+                <Route path="/enrollments" element={<StudentEnrollments />} />
+                <Route
+                  path="/my-assignments"
+                  element={<StudentAssignments />}
+                />
+                <Route path="/my-grades" element={<StudentGrades />} />
+                <Route
+                  path="/academic-records"
+                  element={<StudentAcademicRecords />}
+                />
+                <Route
+                  path="/course-materials"
+                  element={<StudentCourseMaterials />}
+                />
+                <Route path="/discussions" element={<StudentDiscussions />} />
+                <Route
+                  path="/student-assessments"
+                  element={<StudentAssessments />}
+                />
+                <Route
+                  path="/lecturer-course-management"
+                  element={<LecturerCourseManagement />}
+                />
+                <Route
+                  path="/lecturer-assessments"
+                  element={<LecturerAssessments />}
+                />
+                <Route path="/my-courses" element={<LecturerCourses />} />
+                <Route
+                  path="/my-courses/:courseId"
+                  element={<LecturerCourseDetails />}
+                />
+                <Route path="/students" element={<StudentManagement />} />
+                <Route path="/departments" element={<DepartmentManagement />} />
+                <Route path="/programs" element={<ProgramManagement />} />
+                <Route path="/user-management" element={<UserManagement />} />
+                <Route path="/assignments" element={<AssignmentManagement />} />
+                <Route
+                  path="/course-management"
+                  element={<CourseManagement />}
+                />
+                <Route path="/course-analytics" element={<CourseAnalytics />} />
+                <Route
+                  path="/campus-coordination"
+                  element={<CampusCoordination />}
+                />
+                <Route path="/profile" element={<UserProfile />} />
+                <Route path="/settings" element={<Settings />} />
+              </Route>
+            </Routes>
+          </Suspense>
+        </ChunkErrorBoundary>
       </main>
     </div>
   );
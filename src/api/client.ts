@@ -8,8 +8,35 @@ if (!API_BASE) {
 // Append /api to the base URL since your endpoints expect it
 const API_ENDPOINT = `${API_BASE}/api`;
 
+// Per-request debug logging is only useful while developing locally
+const DEBUG_REQUESTS = import.meta.env.DEV;
+
 class APIClient {
-  private async request<T>(
+  // Plain GET requests currently on the wire, keyed by endpoint path, so
+  // concurrent callers asking for the same resource share one round-trip.
+  // Those callers all receive the same parsed object: treat it as read-only
+  private inflight = new Map<string, Promise<unknown>>();
+
+  private request<T>(endpoint: string, options: RequestInit = {}): Promise<T> {
+    // Only coalesce option-less GETs: a caller passing a signal, headers,
+    // cache mode or a method must not share another caller's request
+    if (Object.keys(options).length > 0) {
+      return this.send<T>(endpoint, options);
+    }
+
+    const pending = this.inflight.get(endpoint);
+    if (pending) {
+      return pending as Promise<T>;
+    }
+
+    const promise = this.send<T>(endpoint, options).finally(() => {
+      this.inflight.delete(endpoint);
+    });
+    this.inflight.set(endpoint, promise);
+    return promise;
+  }
+
+  private async send<T>(
     endpoint: string,
     options: RequestInit = {}
   ): Promise<T> {
@@ -24,9 +51,9 @@ class APIClient {
     };
 
     // Debug logging
-    console.log(`Making API request to: ${url}`);
-    console.log(`API_BASE: ${API_BASE}`);
-    console.log(`API_ENDPOINT: ${API_ENDPOINT}`);
+    if (DEBUG_REQUESTS) {
+      console.log(`Making API request to: ${url}`);
+    }
 
     try {
       const response = await fetch(url, config);
@@ -228,18 +255,10 @@ class APIClient {
     return this.request(`/dashboard?range=${range}`);
   }
 
-  // Generic request method for custom endpoints
-  async makeRequest<T>(
-    endpoint: string,
-    options: RequestInit = {}
-  ): Promise<T> {
-    try {
-      return await this.request<T>(endpoint, options);
-    } catch (error) {
-      // Log error but don't throw to prevent console spam
-      console.warn(`API request failed for ${endpoint}:`, error);
-      throw error;
-    }
+  // Generic request method for custom endpoints; failures are already
+  // logged by send(), so errors are passed straight through
+  makeRequest<T>(endpoint: string, options: RequestInit = {}): Promise<T> {
+    return this.request<T>(endpoint, options);
   }
 }
 
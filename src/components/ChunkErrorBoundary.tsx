@@ -0,0 +1,75 @@
+import React, { ReactNode } from "react";
+
+// When the last automatic reload happened, so a chunk that keeps failing
+// (e.g. while offline) doesn't put the page into a reload loop
+const RELOAD_KEY = "chunk-reload-at";
+const RELOAD_COOLDOWN_MS = 10 * 1000;
+
+// Browsers word a failed dynamic import differently:
+// Chrome/Edge, Firefox and Safari respectively
+const isChunkLoadError = (error: Error) =>
+  /Failed to fetch dynamically imported module|error loading dynamically imported module|Importing a module script failed/i.test(
+    error.message
+  );
+
+interface ChunkErrorBoundaryProps {
+  children: ReactNode;
+}
+
+interface ChunkErrorBoundaryState {
+  error: Error | null;
+}
+
+// Lazy-loaded pages are fetched by hashed filename. After a deploy, a tab
+// that is still open asks for chunks that no longer exist, so the import
+// rejects. Reload once to pick up the new build, and offer a manual reload
+// if that didn't help. Other errors are rethrown unchanged.
+class ChunkErrorBoundary extends React.Component<
+  ChunkErrorBoundaryProps,
+  ChunkErrorBoundaryState
+> {
+  state: ChunkErrorBoundaryState = { error: null };
+
+  static getDerivedStateFromError(error: Error): ChunkErrorBoundaryState {
+    return { error };
+  }
+
+  componentDidCatch(error: Error) {
+    if (!isChunkLoadError(error)) return;
+
+    // Without storage there's no way to tell a first failure from a loop,
+    // so leave it to the Reload button
+    try {
+      const lastReload = Number(sessionStorage.getItem(RELOAD_KEY) || 0);
+      if (Date.now() - lastReload <= RELOAD_COOLDOWN_MS) return;
+      sessionStorage.setItem(RELOAD_KEY, String(Date.now()));
+    } catch {
+      return;
+    }
+    window.location.reload();
+  }
+
+  render() {
+    const { error } = this.state;
+    if (!error) return this.props.children;
+    if (!isChunkLoadError(error)) throw error;
+
+    return (
+      <div className="flex flex-col items-center justify-center py-16 text-center">
+        <p className="text-gray-700 mb-4">
+          This page couldn't be loaded. A new version of EduFlow may have been
+          released.
+        </p>
+        <button
+          type="button"
+          onClick={() => window.location.reload()}
+          className="bg-primary-600 text-white px-4 py-2 rounded-lg hover:bg-primary-700 transition-colors"
+        >
+          Reload
+        </button>
+      </div>
+    );
+  }
+}
+
+export default ChunkErrorBoundary;
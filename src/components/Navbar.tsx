@@ -2,6 +2,29 @@ import React, { useState, useRef, useEffect } from "react";
 import { Link, useLocation, useNavigate } from "react-router-dom";
 import { useAuth } from "../hooks/useAuth.tsx";
 
+// Routes that highlight the Academic dropdown, built once at module load
+const ACADEMIC_PATHS = [
+  "/courses",
+  "/enrollments",
+  "/my-assignments",
+  "/my-grades",
+  "/academic-records",
+  "/course-materials",
+  "/discussions",
+  "/student-assessments",
+  "/my-courses",
+  "/lecturer-course-management",
+  "/lecturer-assessments",
+  "/students",
+  "/departments",
+  "/programs",
+  "/course-management",
+  "/user-management",
+  "/campus-coordination",
+  "/assignments",
+  "/academic",
+];
+
 const Navbar: React.FC = () => {
   const { user, logout } = useAuth();
   const location = useLocation();
@@ -69,11 +92,9 @@ const Navbar: React.FC = () => {
     };
   }, [activeDropdown]);
 
-  // Get user role for conditional navigation
-  const getUserRole = () => {
-    // This will be updated when we integrate with the backend user role
-    return user?.role || "student"; // Default to student for now
-  };
+  // User role for conditional navigation, resolved once per render
+  // This will be updated when we integrate with the backend user role
+  const userRole = user?.role || "student"; // Default to student for now
 
   return (
     <nav className="bg-white shadow-lg border-b border-gray-200">
@@ -139,27 +160,7 @@ const Navbar: React.FC = () => {
                     type="button"
                     onClick={() => toggleDropdown("academic")}
                     className={`flex items-center text-gray-600 hover:text-primary-600 transition-colors ${
-                      isDropdownActive([
-                        "/courses",
-                        "/enrollments",
-                        "/my-assignments",
-                        "/my-grades",
-                        "/academic-records",
-                        "/course-materials",
-                        "/discussions",
-                        "/student-assessments",
-                        "/my-courses",
-                        "/lecturer-course-management",
-                        "/lecturer-assessments",
-                        "/students",
-                        "/departments",
-                        "/programs",
-                        "/course-management",
-                        "/user-management",
-                        "/campus-coordination",
-                        "/assignments",
-                        "/academic",
-                      ])
+                      isDropdownActive(ACADEMIC_PATHS)
                         ? "text-primary-600 font-medium"
                         : ""
                     }`}
@@ -174,7 +175,7 @@ const Navbar: React.FC = () => {
 
                   {activeDropdown === "academic" && (
                     <div className="absolute top-full left-0 mt-2 w-48 bg-white rounded-lg shadow-lg border border-gray-200 py-2 z-50">
-                      {getUserRole() === "student" && (
+                      {userRole === "student" && (
                         <>
                           <Link
                             to="/courses"
@@ -242,7 +243,7 @@ const Navbar: React.FC = () => {
                           </Link>
                         </>
                       )}
-                      {getUserRole() === "lecturer" && (
+                      {userRole === "lecturer" && (
                         <>
                           <Link
                             to="/my-courses"
@@ -278,7 +279,7 @@ const Navbar: React.FC = () => {
                           </Link>
                         </>
                       )}
-                      {getUserRole() === "admin" && (
+                      {userRole === "admin" && (
                         <>
                           <Link
                             to="/departments"
@@ -0,0 +1,13 @@
+import React from "react";
+import { Navigate, Outlet } from "react-router-dom";
+import { useAuth } from "../hooks/useAuth";
+
+// Layout route guarding every nested route: the auth check runs once here
+// instead of being repeated in each route's element
+const RequireAuth: React.FC = () => {
+  const { user } = useAuth();
+
+  return user ? <Outlet /> : <Navigate to="/login" />;
+};
+
+export default RequireAuth;
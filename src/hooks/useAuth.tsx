@@ -2,6 +2,8 @@ import {
   useState,
   useEffect,
   useContext,
+  useCallback,
+  useMemo,
   createContext,
   ReactNode,
 } from "react";
@@ -29,40 +31,40 @@ export const AuthProvider = ({ children }: { children: ReactNode }) => {
     }
   };
 
-  const login = async (email: string, password: string) => {
-    try {
-      const response = await apiClient.login(email, password);
-      setUser((response as any).user);
-    } catch (error) {
-      throw error;
-    }
-  };
+  const login = useCallback(async (email: string, password: string) => {
+    const response = await apiClient.login(email, password);
+    setUser((response as any).user);
+  }, []);
 
-  const register = async (name: string, email: string, password: string) => {
-    try {
+  const register = useCallback(
+    async (name: string, email: string, password: string) => {
       const response = await apiClient.register(name, email, password);
       setUser((response as any).user);
-    } catch (error) {
-      throw error;
-    }
-  };
+    },
+    []
+  );
 
-  const logout = async () => {
+  const logout = useCallback(async () => {
     try {
       await apiClient.logout();
       setUser(null);
     } catch (error) {
       setUser(null);
     }
-  };
+  }, []);
 
-  const value: AuthContextType = {
-    user,
-    loading,
-    login,
-    register,
-    logout,
-  };
+  // Keep the context value stable so consumers only re-render when the
+  // auth state actually changes
+  const value = useMemo<AuthContextType>(
+    () => ({
+      user,
+      loading,
+      login,
+      register,
+      logout,
+    }),
+    [user, loading, login, register, logout]
+  );
 
   return <AuthContext.Provider value={value}>{children}</AuthContext.Provider>;
 };
@@ -32,6 +32,15 @@ interface Submission {
   grade?: number;
 }
 
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+const ASSIGNMENT_STATUS = {
+  draft: { text: "Draft", color: "bg-gray-100 text-gray-800" },
+  overdue: { text: "Overdue", color: "bg-red-100 text-red-800" },
+  dueSoon: { text: "Due Soon", color: "bg-yellow-100 text-yellow-800" },
+  active: { text: "Active", color: "bg-green-100 text-green-800" },
+};
+
 const AssignmentManagement: React.FC = () => {
   const {} = useAuth();
   const [loading, setLoading] = useState(true);
@@ -77,9 +86,7 @@ const AssignmentManagement: React.FC = () => {
   const fetchAssignments = async () => {
     try {
       const response = await fetch("/api/assignments", {
-        headers: {
-          Authorization: `Bearer ${localStorage.getItem("token")}`,
-        },
+        credentials: "include",
       });
       if (response.ok) {
         const data = await response.json();
@@ -95,9 +102,7 @@ const AssignmentManagement: React.FC = () => {
   const fetchCourses = async () => {
     try {
       const response = await fetch("/api/courses", {
-        headers: {
-          Authorization: `Bearer ${localStorage.getItem("token")}`,
-        },
+        credentials: "include",
       });
       if (response.ok) {
         const data = await response.json();
@@ -113,9 +118,7 @@ const AssignmentManagement: React.FC = () => {
       const response = await fetch(
         `/api/assignments/${assignmentId}/submissions`,
         {
-          headers: {
-            Authorization: `Bearer ${localStorage.getItem("token")}`,
-          },
+          credentials: "include",
         }
       );
       if (response.ok) {
@@ -132,9 +135,9 @@ const AssignmentManagement: React.FC = () => {
     try {
       const response = await fetch("/api/assignments", {
         method: "POST",
+        credentials: "include",
         headers: {
           "Content-Type": "application/json",
-          Authorization: `Bearer ${localStorage.getItem("token")}`,
         },
         body: JSON.stringify(newAssignment),
       });
@@ -161,9 +164,9 @@ const AssignmentManagement: React.FC = () => {
     try {
       const response = await fetch(`/api/submissions/${submissionId}/grade`, {
         method: "POST",
+        credentials: "include",
         headers: {
           "Content-Type": "application/json",
-          Authorization: `Bearer ${localStorage.getItem("token")}`,
         },
         body: JSON.stringify({
           grade: parseFloat(gradeForm.grade),
@@ -184,26 +187,16 @@ const AssignmentManagement: React.FC = () => {
     }
   };
 
-  const getAssignmentStatusColor = (assignment: Assignment) => {
-    const now = new Date();
-    const dueDate = new Date(assignment.due_date);
-
-    if (!assignment.is_published) return "bg-gray-100 text-gray-800";
-    if (dueDate < now) return "bg-red-100 text-red-800";
-    if (dueDate.getTime() - now.getTime() < 24 * 60 * 60 * 1000)
-      return "bg-yellow-100 text-yellow-800";
-    return "bg-green-100 text-green-800";
-  };
+  // Read the clock once per render; every row's due-date check reuses it
+  const now = Date.now();
 
-  const getAssignmentStatusText = (assignment: Assignment) => {
-    const now = new Date();
-    const dueDate = new Date(assignment.due_date);
+  const getAssignmentStatus = (assignment: Assignment) => {
+    if (!assignment.is_published) return ASSIGNMENT_STATUS.draft;
 
-    if (!assignment.is_published) return "Draft";
-    if (dueDate < now) return "Overdue";
-    if (dueDate.getTime() - now.getTime() < 24 * 60 * 60 * 1000)
-      return "Due Soon";
-    return "Active";
+    const msUntilDue = new Date(assignment.due_date).getTime() - now;
+    if (msUntilDue < 0) return ASSIGNMENT_STATUS.overdue;
+    if (msUntilDue < DAY_MS) return ASSIGNMENT_STATUS.dueSoon;
+    return ASSIGNMENT_STATUS.active;
   };
 
   const getGradeColor = (grade: number, maxPoints: number) => {
@@ -214,6 +207,9 @@ const AssignmentManagement: React.FC = () => {
     return "text-red-600";
   };
 
+  const selectedStatus =
+    selectedAssignment && getAssignmentStatus(selectedAssignment);
+
   if (loading) {
     return (
       <div className="min-h-screen bg-gray-50 flex items-center justify-center">
@@ -288,66 +284,69 @@ const AssignmentManagement: React.FC = () => {
                   </h2>
                 </div>
                 <div className="divide-y divide-gray-200">
-                  {assignments.map((assignment) => (
-                    <div
-                      key={assignment.id}
-                      className={`p-6 cursor-pointer hover:bg-gray-50 ${
-                        selectedAssignment?.id === assignment.id
-                          ? "bg-primary-50"
-                          : ""
-                      }`}
-                      onClick={() => setSelectedAssignment(assignment)}
-                    >
-                      <div className="flex items-start justify-between">
-                        <div className="flex-1">
-                          <h3 className="text-lg font-medium text-gray-900">
-                            {assignment.title}
-                          </h3>
-                          <p className="text-sm text-gray-600">
-                            {assignment.course_code} - {assignment.course_name}
-                          </p>
-                          <p className="text-sm text-gray-500 mt-1">
-                            Due:{" "}
-                            {new Date(assignment.due_date).toLocaleDateString()}{" "}
-                            at{" "}
-                            {new Date(assignment.due_date).toLocaleTimeString()}
-                          </p>
-                          <div className="flex items-center mt-3 space-x-4">
-                            <span className="text-sm text-gray-600">
-                              <i className="fas fa-users mr-1"></i>
-                              {assignment.submission_count} submissions
-                            </span>
-                            <span className="text-sm text-gray-600">
-                              <i className="fas fa-check mr-1"></i>
-                              {assignment.graded_count} graded
+                  {assignments.map((assignment) => {
+                    const status = getAssignmentStatus(assignment);
+                    return (
+                      <div
+                        key={assignment.id}
+                        className={`p-6 cursor-pointer hover:bg-gray-50 ${
+                          selectedAssignment?.id === assignment.id
+                            ? "bg-primary-50"
+                            : ""
+                        }`}
+                        onClick={() => setSelectedAssignment(assignment)}
+                      >
+                        <div className="flex items-start justify-between">
+                          <div className="flex-1">
+                            <h3 className="text-lg font-medium text-gray-900">
+                              {assignment.title}
+                            </h3>
+                            <p className="text-sm text-gray-600">
+                              {assignment.course_code} - {assignment.course_name}
+                            </p>
+                            <p className="text-sm text-gray-500 mt-1">
+                              Due:{" "}
+                              {new Date(assignment.due_date).toLocaleDateString()}{" "}
+                              at{" "}
+                              {new Date(assignment.due_date).toLocaleTimeString()}
+                            </p>
+                            <div className="flex items-center mt-3 space-x-4">
+                              <span className="text-sm text-gray-600">
+                                <i className="fas fa-users mr-1"></i>
+                                {assignment.submission_count} submissions
+                              </span>
+                              <span className="text-sm text-gray-600">
+                                <i className="fas fa-check mr-1"></i>
+                                {assignment.graded_count} graded
+                              </span>
+                              <span className="text-sm text-gray-600">
+                                <i className="fas fa-star mr-1"></i>
+                                {assignment.max_points} points
+                              </span>
+                            </div>
+                          </div>
+                          <div className="flex flex-col items-end space-y-2">
+                            <span
+                              className={`inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium ${
+                                status.color
+                              }`}
+                            >
+                              {status.text}
                             </span>
-                            <span className="text-sm text-gray-600">
-                              <i className="fas fa-star mr-1"></i>
-                              {assignment.max_points} points
+                            <span className="text-xs text-gray-500 capitalize">
+                              {assignment.assignment_type}
                             </span>
                           </div>
                         </div>
-                        <div className="flex flex-col items-end space-y-2">
-                          <span
-                            className={`inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium ${getAssignmentStatusColor(
-                              assignment
-                            )}`}
-                          >
-                            {getAssignmentStatusText(assignment)}
-                          </span>
-                          <span className="text-xs text-gray-500 capitalize">
-                            {assignment.assignment_type}
-                          </span>
-                        </div>
                       </div>
-                    </div>
-                  ))}
+                    );
+                  })}
                 </div>
               </div>
             </div>
 
             <div>
-              {selectedAssignment ? (
+              {selectedAssignment && selectedStatus ? (
                 <div className="bg-white rounded-lg shadow-sm border border-gray-200">
                   <div className="px-6 py-4 border-b border-gray-200">
                     <h2 className="text-lg font-semibold text-gray-900">
@@ -392,11 +391,11 @@ const AssignmentManagement: React.FC = () => {
                       <div className="flex justify-between">
                         <span className="text-gray-600">Status</span>
                         <span
-                          className={`inline-flex items-center px-2 py-1 rounded-full text-xs font-medium ${getAssignmentStatusColor(
-                            selectedAssignment
-                          )}`}
+                          className={`inline-flex items-center px-2 py-1 rounded-full text-xs font-medium ${
+                            selectedStatus.color
+                          }`}
                         >
-                          {getAssignmentStatusText(selectedAssignment)}
+                          {selectedStatus.text}
                         </span>
                       </div>
                     </div>
@@ -57,36 +57,42 @@ const CourseManagement: React.FC = () => {
     syllabus: "",
   });
 
+  // Filters are applied client-side, so the data only needs loading once
   useEffect(() => {
     fetchData();
-  }, [filters]);
+  }, []);
+
+  const fetchCourses = async () => {
+    const coursesResponse = await fetch("/api/academic/courses", {
+      credentials: "include",
+    });
+    if (coursesResponse.ok) {
+      const coursesData = await coursesResponse.json();
+      setCourses(coursesData.courses);
+    }
+  };
 
   const fetchData = async () => {
     try {
       setLoading(true);
 
-      // Fetch courses
-      const coursesResponse = await fetch("/api/academic/courses", {
-        credentials: "include",
-      });
-      if (coursesResponse.ok) {
-        const coursesData = await coursesResponse.json();
-        setCourses(coursesData.courses);
-      }
+      // Departments and semesters are reference data that course mutations
+      // don't change; only courses are refetched after a create or delete
+      const [, deptResponse, semesterResponse] = await Promise.all([
+        fetchCourses(),
+        fetch("/api/academic/departments", {
+          credentials: "include",
+        }),
+        fetch("/api/academic/semesters", {
+          credentials: "include",
+        }),
+      ]);
 
-      // Fetch departments
-      const deptResponse = await fetch("/api/academic/departments", {
-        credentials: "include",
-      });
       if (deptResponse.ok) {
         const deptData = await deptResponse.json();
         setDepartments(deptData.departments);
       }
 
-      // Fetch semesters
-      const semesterResponse = await fetch("/api/academic/semesters", {
-        credentials: "include",
-      });
       if (semesterResponse.ok) {
         const semesterData = await semesterResponse.json();
         setSemesters(semesterData.semesters);
@@ -98,6 +104,14 @@ const CourseManagement: React.FC = () => {
     }
   };
 
+  const refreshCourses = async () => {
+    try {
+      await fetchCourses();
+    } catch (error) {
+      console.error("Failed to fetch courses:", error);
+    }
+  };
+
   const handleCreateCourse = async (e: React.FormEvent) => {
     e.preventDefault();
     setSubmitting(true);
@@ -130,7 +144,7 @@ const CourseManagement: React.FC = () => {
           prerequisites: "",
           syllabus: "",
         });
-        fetchData();
+        refreshCourses();
       } else {
         const errorData = await response.json();
         setError(errorData.detail || "Failed to create course");
@@ -176,7 +190,7 @@ const CourseManagement: React.FC = () => {
       });
 
       if (response.ok) {
-        fetchData();
+        refreshCourses();
       }
     } catch (error) {
       console.error("Failed to delete course:", error);
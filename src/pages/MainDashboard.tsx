@@ -1,9 +1,12 @@
-import React from "react";
+import React, { lazy } from "react";
 import { useAuth } from "../hooks/useAuth";
-import AdminDashboard from "./AdminDashboard";
-import StudentDashboard from "./StudentDashboard";
-import LecturerDashboard from "./LecturerDashboard";
-import Dashboard from "./Dashboard"; // Fallback to original analytics dashboard
+
+// Each role only ever sees one dashboard, so load them on demand rather than
+// shipping all four to every user
+const AdminDashboard = lazy(() => import("./AdminDashboard"));
+const StudentDashboard = lazy(() => import("./StudentDashboard"));
+const LecturerDashboard = lazy(() => import("./LecturerDashboard"));
+const Dashboard = lazy(() => import("./Dashboard")); // Fallback to original analytics dashboard
 
 const MainDashboard: React.FC = () => {
   const { user } = useAuth();
@@ -68,19 +68,21 @@ const StudentAcademicRecords: React.FC = () => {
     try {
       setLoading(true);
 
-      // Fetch academic record overview
-      const recordResponse = await fetch("/api/student/academic-record", {
-        credentials: "include",
-      });
+      // Fetch the academic record overview and transcript in parallel
+      const [recordResponse, transcriptResponse] = await Promise.all([
+        fetch("/api/student/academic-record", {
+          credentials: "include",
+        }),
+        fetch("/api/student/transcript", {
+          credentials: "include",
+        }),
+      ]);
+
       if (recordResponse.ok) {
         const recordData = await recordResponse.json();
         setAcademicRecord(recordData.record);
       }
 
-      // Fetch transcript
-      const transcriptResponse = await fetch("/api/student/transcript", {
-        credentials: "include",
-      });
       if (transcriptResponse.ok) {
         const transcriptData = await transcriptResponse.json();
         setTranscript(transcriptData.transcript);
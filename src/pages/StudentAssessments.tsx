@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from "react";
+import React, { useState, useEffect, useRef } from "react";
 import {
   BookOpen,
   Clock,
@@ -85,6 +85,10 @@ const StudentAssessments: React.FC = () => {
   const [selectedAssignment, setSelectedAssignment] =
     useState<Assignment | null>(null);
   const [quizAttempts, setQuizAttempts] = useState<QuizAttempt[]>([]);
+  const [startingQuiz, setStartingQuiz] = useState(false);
+  // Synchronous guard so a double click can't fire two start requests and
+  // burn an extra attempt before the disabled state renders
+  const startingQuizRef = useRef(false);
 
   useEffect(() => {
     fetchCourses();
@@ -137,6 +141,10 @@ const StudentAssessments: React.FC = () => {
   };
 
   const startQuiz = async (quizId: number) => {
+    if (startingQuizRef.current) return;
+    startingQuizRef.current = true;
+    setStartingQuiz(true);
+
     try {
       const response = await fetch(`/api/quizzes/${quizId}/start`, {
         method: "POST",
@@ -144,12 +152,17 @@ const StudentAssessments: React.FC = () => {
       });
       if (response.ok) {
         const data = await response.json();
-        // Redirect to quiz taking interface
+        // Redirect to quiz taking interface; keep the guard set so a click
+        // while the page unloads can't start a second attempt
         window.location.href = `/quiz-attempt/${data.attempt_id}`;
+        return;
       }
     } catch (error) {
       console.error("Error starting quiz:", error);
     }
+
+    startingQuizRef.current = false;
+    setStartingQuiz(false);
   };
 
   const fetchQuizAttempts = async (quizId: number) => {
@@ -379,7 +392,8 @@ const StudentAssessments: React.FC = () => {
                         quiz.my_attempts < quiz.max_attempts && (
                           <button
                             onClick={() => startQuiz(quiz.id)}
-                            className="flex-1 bg-blue-600 text-white px-4 py-2 rounded-lg hover:bg-blue-700 flex items-center justify-center"
+                            disabled={startingQuiz}
+                            className="flex-1 bg-blue-600 text-white px-4 py-2 rounded-lg hover:bg-blue-700 disabled:opacity-50 flex items-center justify-center"
                           >
                             <Play className="w-4 h-4 mr-2" />
                             Start Quiz
@@ -765,7 +779,8 @@ const StudentAssessments: React.FC = () => {
                             setShowQuizModal(false);
                             startQuiz(selectedQuiz.id);
                           }}
-                          className="px-4 py-2 bg-blue-600 text-white rounded-md hover:bg-blue-700"
+                          disabled={startingQuiz}
+                          className="px-4 py-2 bg-blue-600 text-white rounded-md hover:bg-blue-700 disabled:opacity-50"
                         >
                           Start Quiz
                         </button>
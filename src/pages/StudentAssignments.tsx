@@ -19,21 +19,9 @@ interface Assignment {
   file_name?: string;
 }
 
-interface Submission {
-  id: number;
-  assignment_id: number;
-  file_name?: string;
-  comments: string;
-  submitted_at: string;
-  grade?: number;
-  feedback?: string;
-  is_late: boolean;
-}
-
 const StudentAssignments: React.FC = () => {
   const {} = useAuth();
   const [assignments, setAssignments] = useState<Assignment[]>([]);
-  const [, setSubmissions] = useState<Submission[]>([]);
   const [loading, setLoading] = useState(true);
   const [activeTab, setActiveTab] = useState<
     "pending" | "submitted" | "graded"
@@ -45,9 +33,11 @@ const StudentAssignments: React.FC = () => {
   const [submissionComments, setSubmissionComments] = useState("");
   const [submitting, setSubmitting] = useState(false);
 
+  // Each assignment row already carries the student's submission state
+  // (is_submitted, submission_date, grade, feedback, file_name), so the
+  // separate submissions list isn't needed to render this page
   useEffect(() => {
     fetchAssignments();
-    fetchSubmissions();
   }, []);
 
   const fetchAssignments = async () => {
@@ -68,21 +58,6 @@ const StudentAssignments: React.FC = () => {
     }
   };
 
-  const fetchSubmissions = async () => {
-    try {
-      const response = await fetch("/api/student/submissions", {
-        credentials: "include",
-      });
-
-      if (response.ok) {
-        const data = await response.json();
-        setSubmissions(data.submissions || []);
-      }
-    } catch (error) {
-      console.error("Error fetching submissions:", error);
-    }
-  };
-
   const handleSubmitAssignment = async (e: React.FormEvent) => {
     e.preventDefault();
     if (!selectedAssignment || !submissionFile) return;
@@ -108,7 +83,6 @@ const StudentAssignments: React.FC = () => {
         setSubmissionFile(null);
         setSubmissionComments("");
         fetchAssignments();
-        fetchSubmissions();
       }
     } catch (error) {
       console.error("Failed to submit assignment:", error);
@@ -149,6 +123,24 @@ const StudentAssignments: React.FC = () => {
     }
   });
 
+  // Tally the stats cards in a single pass over the assignments
+  const stats = assignments.reduce(
+    (acc, a) => {
+      if (a.grade !== undefined) {
+        acc.graded += 1;
+        acc.percentageSum += (a.grade / a.max_points) * 100;
+      } else if (a.is_submitted) {
+        acc.submitted += 1;
+      } else {
+        acc.pending += 1;
+      }
+      return acc;
+    },
+    { pending: 0, submitted: 0, graded: 0, percentageSum: 0 }
+  );
+  const averageGrade =
+    stats.graded > 0 ? Math.round(stats.percentageSum / stats.graded) : 0;
+
   if (loading) {
     return (
       <div className="min-h-screen bg-gray-50 flex items-center justify-center">
@@ -183,11 +175,7 @@ const StudentAssignments: React.FC = () => {
               <div className="ml-4">
                 <p className="text-sm font-medium text-gray-500">Pending</p>
                 <p className="text-2xl font-semibold text-gray-900">
-                  {
-                    assignments.filter(
-                      (a) => !a.is_submitted && a.grade === undefined
-                    ).length
-                  }
+                  {stats.pending}
                 </p>
               </div>
             </div>
@@ -201,11 +189,7 @@ const StudentAssignments: React.FC = () => {
               <div className="ml-4">
                 <p className="text-sm font-medium text-gray-500">Submitted</p>
                 <p className="text-2xl font-semibold text-gray-900">
-                  {
-                    assignments.filter(
-                      (a) => a.is_submitted && a.grade === undefined
-                    ).length
-                  }
+                  {stats.submitted}
                 </p>
               </div>
             </div>
@@ -219,7 +203,7 @@ const StudentAssignments: React.FC = () => {
               <div className="ml-4">
                 <p className="text-sm font-medium text-gray-500">Graded</p>
                 <p className="text-2xl font-semibold text-gray-900">
-                  {assignments.filter((a) => a.grade !== undefined).length}
+                  {stats.graded}
                 </p>
               </div>
             </div>
@@ -235,19 +219,7 @@ const StudentAssignments: React.FC = () => {
                   Average Grade
                 </p>
                 <p className="text-2xl font-semibold text-gray-900">
-                  {assignments.filter((a) => a.grade !== undefined).length > 0
-                    ? Math.round(
-                        assignments
-                          .filter((a) => a.grade !== undefined)
-                          .reduce(
-                            (sum, a) => sum + (a.grade! / a.max_points) * 100,
-                            0
-                          ) /
-                          assignments.filter((a) => a.grade !== undefined)
-                            .length
-                      )
-                    : 0}
-                  %
+                  {averageGrade}%
                 </p>
               </div>
             </div>
@@ -43,20 +43,26 @@ const StudentGrades: React.FC = () => {
   const [courseGrades, setCourseGrades] = useState<CourseGrade[]>([]);
   const [semesters, setSemesters] = useState<Semester[]>([]);
   const [selectedSemester, setSelectedSemester] = useState<number | null>(null);
+  const [semestersLoaded, setSemestersLoaded] = useState(false);
   const [loading, setLoading] = useState(true);
   const [activeTab, setActiveTab] = useState<
     "overview" | "courses" | "assignments"
   >("overview");
 
+  // Semesters don't depend on the selection, so load them once; grades wait
+  // until the default semester is known to avoid a throwaway unfiltered fetch
   useEffect(() => {
-    fetchGradesData();
-  }, [selectedSemester]);
+    fetchSemesters();
+  }, []);
 
-  const fetchGradesData = async () => {
-    try {
-      setLoading(true);
+  useEffect(() => {
+    if (semestersLoaded) {
+      fetchGradesData();
+    }
+  }, [selectedSemester, semestersLoaded]);
 
-      // Fetch semesters
+  const fetchSemesters = async () => {
+    try {
       const semestersResponse = await fetch("/api/student/semesters", {
         credentials: "include",
       });
@@ -72,30 +78,36 @@ const StudentGrades: React.FC = () => {
           );
         }
       }
+    } catch (error) {
+      console.error("Error fetching semesters:", error);
+    } finally {
+      setSemestersLoaded(true);
+    }
+  };
 
-      // Fetch grades for selected semester
-      const gradesResponse = await fetch(
-        `/api/student/grades${
-          selectedSemester ? `?semester_id=${selectedSemester}` : ""
-        }`,
-        {
+  const fetchGradesData = async () => {
+    try {
+      setLoading(true);
+
+      const semesterQuery = selectedSemester
+        ? `?semester_id=${selectedSemester}`
+        : "";
+
+      // Assignment grades and course grades are independent; fetch together
+      const [gradesResponse, courseGradesResponse] = await Promise.all([
+        fetch(`/api/student/grades${semesterQuery}`, {
           credentials: "include",
-        }
-      );
+        }),
+        fetch(`/api/student/course-grades${semesterQuery}`, {
+          credentials: "include",
+        }),
+      ]);
+
       if (gradesResponse.ok) {
         const gradesData = await gradesResponse.json();
         setGrades(gradesData.grades || []);
       }
 
-      // Fetch course grades
-      const courseGradesResponse = await fetch(
-        `/api/student/course-grades${
-          selectedSemester ? `?semester_id=${selectedSemester}` : ""
-        }`,
-        {
-          credentials: "include",
-        }
-      );
       if (courseGradesResponse.ok) {
         const courseGradesData = await courseGradesResponse.json();
         setCourseGrades(courseGradesData.course_grades || []);